@@ -1,56 +1,132 @@
 # Hydroponic Data Collector - Ryan Cohen, 2023
 # Version 0.1.0
-# 
-# This is meant to be run as a cron script every 5 minutes.
 #
-# The script connects to a Hydro Manager and collects data from it. This data
-# is immediately logged into a MySQL database.
+# This runs as a long-lived daemon that polls every 5 minutes, so the
+# interpreter startup and module imports are paid once instead of per poll.
+#
+# The daemon connects to one or more Hydro Managers and collects data from
+# them. This data is immediately logged into a MySQL database.
 #
 # Currently, it only collects basic pH data. In the future, it will also collect
 # other sensors, events, and logs.
-import mysql.connector, datetime, requests, sys
+import mysql.connector, datetime, sys
+import asyncio
+import aiohttp
+
+
+# The timeout keeps a dead device from hanging a poll cycle indefinitely.
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(connect=2, total=10)
 
+# Seconds between poll cycles.
+POLL_INTERVAL = 300
 
 CONFIG = {
     'user': 'root',
     'password': '',
     'host': '127.0.0.1',
     'database': 'HydroCollection',
-    'raise_on_warnings': True
+    'raise_on_warnings': True,
+    'autocommit': False,
+    'use_pure': False
 }
 
 
-if __name__ == '__main__':
-    if len(sys.argv) != 2:
-        print("USAGE: python3 hydro_collector.py IP_ADDR")
-        sys.exit(1)
+async def fetch_mailbox(session, ip):
+    async with session.get(f'http://{ip}/json/mailbox.json',
+                           timeout=REQUEST_TIMEOUT) as req:
+        return await req.json()
 
-    ip = sys.argv[1]
 
-    req = requests.get(f'http://{ip}/json/mailbox.json')
-    json = req.json()
-    json['time'] += 14400    # temporary timestamp offset to UTC. FIX IN HYDRO MANAGER
-    json['time'] = datetime.datetime.fromtimestamp(json['time'])
-    time = json['time']
+async def fetch_all_mailboxes(session, ips):
+    # The requests overlap, so a poll of N devices takes about as long as the
+    # slowest device instead of the sum of all of them.
+    results = await asyncio.gather(*(fetch_mailbox(session, ip) for ip in ips),
+                                   return_exceptions=True)
 
-    json['time'] = str(json['time'])
-    print(json)
+    # One unreachable device should not cost the whole cycle; skip it and
+    # keep the rest. sensor_id stays tied to the device's position in the
+    # IP list, not to how many devices happened to answer.
+    mailboxes = []
+    for sensor_id, (ip, result) in enumerate(zip(ips, results), start=1):
+        if isinstance(result, Exception):
+            print(f"Failed to fetch mailbox from {ip}: {result}", file=sys.stderr)
+        else:
+            mailboxes.append((sensor_id, result))
+    return mailboxes
 
-    cnx = mysql.connector.connect(**CONFIG)
+
+def store_mailboxes(cnx, mailboxes):
+    readings = []
+    pulses = []
+    for sensor_id, json in mailboxes:
+        json['time'] += 14400    # temporary timestamp offset to UTC. FIX IN HYDRO MANAGER
+        # Timestamps stay as epoch seconds; MySQL converts them with
+        # FROM_UNIXTIME instead of a Python datetime object per row.
+        time = json['time']
+
+        json['time'] = str(datetime.datetime.fromtimestamp(time))
+        print(json)
+
+        if 'pulse_events' in json:
+            pulses += [(event['time'] + 14400, event['type'], event['len'], event['interrupt'])
+                       for event in json['pulse_events']]
+        readings.append((time,sensor_id,json['ph'],0))
+
+    # The connection lives as long as the daemon, so make sure it is still
+    # alive before using it; reconnect transparently if the server dropped it.
+    cnx.ping(reconnect=True)
+
+    # A plain cursor, not prepared=True: the prepared cursor's executemany
+    # just loops execute() per row, while the plain one rewrites the batch
+    # into a single multi-row INSERT on the wire.
     cursor = cnx.cursor()
 
-    if 'pulse_events' in json:
-        for event in json['pulse_events']:
-            query = ("INSERT INTO pump_pulses (timestamp,pump_id,pulse_length,interrupted)"
-                     "VALUES (%s,%s,%s,%s)")
-            cursor.execute(query, (datetime.datetime.fromtimestamp(event['time'] + 14400), event['type'], event['len'], event['interrupt']))
+    try:
+        # One explicit transaction per poll cycle: every device's inserts share
+        # a single commit (and fsync) instead of per-statement overhead.
+        cnx.start_transaction(isolation_level='READ COMMITTED')
+
+        if pulses:
+            query = ("INSERT INTO pump_pulses (timestamp,pump_id,pulse_length,interrupted) "
+                     "VALUES (FROM_UNIXTIME(%s),%s,%s,%s)")
+            cursor.executemany(query, pulses)
+
+        query = ("INSERT INTO sensor_readings (timestamp,sensor_id,sensor_reading,sensor_type_index) "
+                 "VALUES (FROM_UNIXTIME(%s),%s,%s,%s)")
+        cursor.executemany(query, readings)
+
+        cnx.commit()
+    except Exception:
+        # Roll back so a failed cycle does not leave the transaction open;
+        # start_transaction raises on this connection forever otherwise.
+        cnx.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    print("Committed readings to database")
 
-    query = ("INSERT INTO sensor_readings (timestamp,sensor_id,sensor_reading,sensor_type_index) "
-             "VALUES (%s,%s,%s,%s)")
-    cursor.execute(query, (time,1,json['ph'],0))
-    cnx.commit()
 
-    cursor.close()
-    cnx.close()
-    print("Committed reading to database")
+async def main(ips):
+    # The DB connection and HTTP session live for the whole daemon, so each
+    # poll cycle reuses them instead of reconnecting.
+    cnx = mysql.connector.connect(**CONFIG)
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                mailboxes = await fetch_all_mailboxes(session, ips)
+                if mailboxes:
+                    store_mailboxes(cnx, mailboxes)
+            except Exception as error:
+                # A flaky device or DB hiccup should not kill the daemon;
+                # the next poll cycle will try again.
+                print(f"Poll cycle failed: {error}", file=sys.stderr)
+            await asyncio.sleep(POLL_INTERVAL)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("USAGE: python3 hydro_collector.py IP_ADDR [IP_ADDR ...]")
+        sys.exit(1)
 
+    asyncio.run(main(sys.argv[1:]))
@@ -0,0 +1,28 @@
+# Hydroponic Data View - Ryan Cohen, 2023
+# Version 0.1.0
+#
+# This program serves a website that will be used to view the database in
+# charts and tables.
+#
+# Currently, nothing is displayed yet. The first view will be a pH chart.
+from flask import Flask
+from flask_caching import Cache
+from flask_compress import Compress
+
+cache = Cache()
+compress = Compress()
+
+
+def create_app():
+    app = Flask(__name__)
+    cache.init_app(app, config={'CACHE_TYPE': 'SimpleCache',
+                                'CACHE_DEFAULT_TIMEOUT': 120})
+
+    # The chart payload is repetitive numeric text, so it compresses well.
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 512
+    compress.init_app(app)
+
+    from . import views
+    app.register_blueprint(views.bp)
+    return app
@@ -1,91 +1,114 @@
-Highcharts.stockChart('container', {
-    chart: {
-    },
-    rangeSelector: {
-        selected: 5,
-        enabled: true,
-        buttons: [{
-            type: 'hour',
-            count: 1,
-            text: '1h',
-            title: 'View 1 hour'
+// Unpack the server's structure-of-arrays binary series (base64 uint32
+// epoch seconds + float32 values) into Highcharts [timestamp_ms, value]
+// point pairs.
+function decodeSeries(series) {
+    const timeBytes = Uint8Array.from(atob(series.t), (c) => c.charCodeAt(0));
+    const valueBytes = Uint8Array.from(atob(series.v), (c) => c.charCodeAt(0));
+    const times = new Uint32Array(timeBytes.buffer);
+    const values = new Float32Array(valueBytes.buffer);
+
+    const points = new Array(times.length);
+    for (let i = 0; i < times.length; i++) {
+        points[i] = [times[i] * 1000, values[i]];
+    }
+    return points;
+}
+
+function drawPhChart(ph_data, ph_down, ph_up) {
+    const pulseFlags = (pulses) => pulses.map(([timestamp, length]) => ({
+        x: timestamp,
+        text: `${length} ms`,
+    }));
+
+    Highcharts.stockChart('container', {
+        chart: {
         },
-        {
-            type: 'hour',
-            count: 3,
-            text: '3h',
-            title: 'View 3 hours'
+        rangeSelector: {
+            selected: 5,
+            enabled: true,
+            buttons: [{
+                type: 'hour',
+                count: 1,
+                text: '1h',
+                title: 'View 1 hour'
+            },
+            {
+                type: 'hour',
+                count: 3,
+                text: '3h',
+                title: 'View 3 hours'
+            },
+            {
+                type: 'hour',
+                count: 6,
+                text: '6h',
+                title: 'View 6 hours'
+            },
+            {
+                type: 'hour',
+                count: 12,
+                text: '12h',
+                title: 'View 12 hours'
+            },
+            {
+                type: 'day',
+                count: 1,
+                text: '1d',
+                title: 'View 1 day'
+            },
+            {
+                type: 'all',
+                text: 'All',
+                title: 'View all'
+            }]
         },
-        {
-            type: 'hour',
-            count: 6,
-            text: '6h',
-            title: 'View 6 hours'
+        title: {
+            text: 'pH Over Time',
+            align: 'left'
         },
-        {
-            type: 'hour',
-            count: 12,
-            text: '12h',
-            title: 'View 12 hours'
+        xAxis: {
+            type: 'datetime'
         },
-        {
-            type: 'day',
-            count: 1,
-            text: '1d',
-            title: 'View 1 day'
+        yAxis: {
+            title: {
+                text: 'pH'
+            }
         },
-        {
-            type: 'all',
-            text: 'All',
-            title: 'View all'
-        }]
-    },
-    title: {
-        text: 'pH Over Time',
-        align: 'left'
-    },
-    xAxis: {
-        type: 'datetime'
-    },
-    yAxis: {
-        title: {
-            text: 'pH'
-        }
-    },
-    legend: {
-        enabled: false
-    },
-    plotOptions: {
-        series: {
-            marker: {
-                enabled: true,
-                radius: 2.5
-            },
+        legend: {
+            enabled: false
         },
-        flags: {
-            allowOverlapX: true,
+        plotOptions: {
+            series: {
+                marker: {
+                    enabled: true,
+                    radius: 2.5
+                },
+            },
+            flags: {
+                allowOverlapX: true,
+            },
         },
-    },
 
-    series: [{
-        type: 'spline',
-        name: 'pH',
-        data: ph_data,
-        id: 'phSeries',
-    },
-    {
-        type: 'flags',
-        name: 'pH Down Pump Pulses',
-        data: ph_down,
-        title: 'pH Down',
-        onSeries: 'phSeries',
-    },
-    {
-        type: 'flags',
-        name: 'pH Up Pump Events',
-        data: ph_up,
-        title: 'pH Up',
-        onSeries: 'phSeries',
-    }
-    ]
-});
+        series: [{
+            type: 'spline',
+            name: 'pH',
+            data: ph_data,
+            id: 'phSeries',
+        },
+        {
+            type: 'flags',
+            name: 'pH Down Pump Pulses',
+            data: pulseFlags(ph_down),
+            title: 'pH Down',
+            onSeries: 'phSeries',
+        },
+        {
+            type: 'flags',
+            name: 'pH Up Pump Events',
+            data: pulseFlags(ph_up),
+            title: 'pH Up',
+            onSeries: 'phSeries',
+        }
+        ]
+    });
+}
@@ -0,0 +1,113 @@
+# Views for the pH chart and its backing data endpoint.
+from flask import Blueprint, current_app, render_template, request
+import base64
+import hashlib
+import numpy as np
+import orjson
+from mysql.connector.pooling import MySQLConnectionPool
+
+from . import cache
+
+bp = Blueprint('status', __name__)
+
+USER = 'root'
+PASSWORD = ''
+HOST = '127.0.0.1'
+DATABASE = 'testing'
+
+# Pooled connections are reused across requests, so each request skips the
+# TCP+auth handshake that a fresh connect() would pay. use_pure=False picks
+# the C extension, which decodes rows in C instead of Python.
+POOL = MySQLConnectionPool(pool_name='hydro_data_view', pool_size=8,
+                           user=USER, password=PASSWORD,
+                           host=HOST, database=DATABASE,
+                           use_pure=False)
+
+# How far back the chart queries look. Without a window the queries return
+# the full table, so memory grows with all recorded history.
+HISTORY_DAYS = 7
+
+# pH readings are averaged into buckets of this many seconds, matching the
+# collector's 5-minute cadence, so the chart never transfers more points
+# than it can usefully draw.
+BUCKET_SECONDS = 300
+
+# The timezone hack (UTC seconds to EST milliseconds) happens in SQL so
+# MySQL does the arithmetic instead of a per-row Python loop.
+PH_DATA_QUERY = ("SELECT (FLOOR(UNIX_TIMESTAMP(timestamp) / %s) * %s - 14400) * 1000 AS bucket, "
+                 "AVG(CAST(sensor_reading AS DOUBLE)) "
+                 "FROM sensor_readings "
+                 "WHERE timestamp >= NOW() - INTERVAL %s DAY "
+                 "GROUP BY bucket ORDER BY bucket")
+
+PUMP_PULSE_QUERY = ("SELECT (UNIX_TIMESTAMP(timestamp) - 14400) * 1000, pulse_length "
+                    "FROM pump_pulses WHERE pump_id = %s "
+                    "AND timestamp >= NOW() - INTERVAL %s DAY ORDER BY timestamp")
+
+@bp.route("/")
+def root_page():
+    return "<p><a href='/status'>KEEP GOING</a></p>"
+
+
+@cache.memoize(120)
+def get_ph_data():
+    # The finally ensures the connection goes back to the pool even when a
+    # query fails; a leaked slot would never be refilled.
+    cnx = POOL.get_connection()
+    try:
+        cursor = cnx.cursor()
+        cursor.execute(PH_DATA_QUERY, (BUCKET_SECONDS, BUCKET_SECONDS, HISTORY_DAYS))
+        # Kept as a NumPy array; serialization converts it once at the edge.
+        ph_data = np.asarray(cursor.fetchall(), dtype=np.float64).reshape(-1, 2)
+        cursor.close()
+    finally:
+        cnx.close()
+    return ph_data
+
+
+@cache.memoize(120)
+def get_pump_pulses():
+    cnx = POOL.get_connection()
+    try:
+        cursor = cnx.cursor()
+        cursor.execute(PUMP_PULSE_QUERY, (1, HISTORY_DAYS))
+        ph_down = np.asarray(cursor.fetchall(), dtype=np.float64).reshape(-1, 2)
+        cursor.execute(PUMP_PULSE_QUERY, (2, HISTORY_DAYS))
+        ph_up = np.asarray(cursor.fetchall(), dtype=np.float64).reshape(-1, 2)
+        cursor.close()
+    finally:
+        cnx.close()
+    return ph_down, ph_up
+
+
+def pack_series(series):
+    # Structure-of-arrays binary packing: uint32 epoch seconds (millisecond
+    # timestamps would overflow 32 bits) plus float32 values, base64'd.
+    # Far smaller on the wire than a [[t, v], ...] JSON list.
+    times = (series[:, 0] / 1000.0).astype(np.uint32)
+    values = series[:, 1].astype(np.float32)
+    return {'t': base64.b64encode(times.tobytes()).decode('ascii'),
+            'v': base64.b64encode(values.tobytes()).decode('ascii')}
+
+
+@bp.route("/status")
+def status_page():
+    # The chart data is fetched separately from /status/data, so this page
+    # is a static render the browser can cache.
+    return render_template('status.html')
+
+
+@bp.route("/status/data")
+def status_data():
+    ph_data = get_ph_data()
+    ph_down, ph_up = get_pump_pulses()
+    # orjson serializes in native code, skipping the stdlib's Python-level
+    # encoder that Flask's jsonify goes through.
+    body = orjson.dumps({'ph_data': pack_series(ph_data),
+                         'ph_down': pack_series(ph_down),
+                         'ph_up': pack_series(ph_up)})
+    response = current_app.response_class(body, mimetype='application/json')
+    # An ETag over the body lets the browser revalidate with If-None-Match
+    # and get an empty 304 whenever the data has not changed since last hit.
+    response.set_etag(hashlib.blake2b(body, digest_size=16).hexdigest())
+    return response.make_conditional(request)
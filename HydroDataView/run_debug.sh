@@ -3,4 +3,4 @@
 set -e
 
 . .venv/bin/activate
-flask --app hydro_data_view.app:app run --debug
+flask --app hydro_data_view run --debug
@@ -7,7 +7,8 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     zip_safe=False,
-    install_requires=['Flask', 'mysql-connector-python']
+    install_requires=['Flask', 'Flask-Caching', 'Flask-Compress',
+                      'mysql-connector-python', 'numpy', 'orjson']
 )
 
 